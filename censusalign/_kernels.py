@@ -0,0 +1,140 @@
+import numba
+import numpy as np
+
+
+@numba.njit(nogil=True, cache=True)
+def _block_sum(values, start, n):
+    """
+    Sums a block of at most 128 values the way NumPy does: a plain loop below
+    8 values, otherwise eight interleaved partial sums combined pairwise.
+    """
+    if n < 8:
+        total = 0.0
+        for i in range(start, start + n):
+            total += values[i]
+        return total
+    partial = values[start : start + 8].copy()
+    i = 8
+    while i < n - n % 8:
+        for j in range(8):
+            partial[j] += values[start + i + j]
+        i += 8
+    total = ((partial[0] + partial[1]) + (partial[2] + partial[3])) + (
+        (partial[4] + partial[5]) + (partial[6] + partial[7])
+    )
+    while i < n:
+        total += values[start + i]
+        i += 1
+    return total
+
+
+@numba.njit(nogil=True, cache=True)
+def _pairwise_sum(values, start, n):
+    """
+    Sums `values[start:start + n]` in exactly the order NumPy's float `sum` does.
+
+    NumPy splits more than 128 values into two halves at a multiple of 8, sums
+    each half the same way and adds the results. A plain running total can
+    differ in the last bit, which matters when Hamilton rounding rounds a
+    remainder sum near x.5. The halving is walked with explicit stacks, as
+    Numba cannot reliably cache recursive functions.
+    """
+    # Pending ranges, each either still to split (stage 0) or waiting for
+    # the sums of its two halves to be added (stage 1)
+    range_start = np.empty(192, dtype=np.int64)
+    range_length = np.empty(192, dtype=np.int64)
+    range_stage = np.empty(192, dtype=np.int64)
+    sums = np.empty(64)
+    n_ranges = 1
+    n_sums = 0
+    range_start[0] = start
+    range_length[0] = n
+    range_stage[0] = 0
+    while n_ranges > 0:
+        n_ranges -= 1
+        s = range_start[n_ranges]
+        m = range_length[n_ranges]
+        if range_stage[n_ranges] == 1:
+            n_sums -= 1
+            sums[n_sums - 1] += sums[n_sums]
+        elif m <= 128:
+            sums[n_sums] = _block_sum(values, s, m)
+            n_sums += 1
+        else:
+            half = m // 2
+            half -= half % 8
+            # Queue the combine step, then the right half, then the left half,
+            # so the left half is summed first
+            range_start[n_ranges] = s
+            range_length[n_ranges] = m
+            range_stage[n_ranges] = 1
+            range_start[n_ranges + 1] = s + half
+            range_length[n_ranges + 1] = m - half
+            range_stage[n_ranges + 1] = 0
+            range_start[n_ranges + 2] = s
+            range_length[n_ranges + 2] = half
+            range_stage[n_ranges + 2] = 0
+            n_ranges += 3
+    return sums[0]
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def hamilton_floor_sorted(raw, group_start, group_end, out):
+    """
+    Applies Hamilton rounding to each contiguous group of a group-sorted array.
+
+    Group `g` spans rows `group_start[g]:group_end[g]` of `raw`. Within every
+    column, each value is floored and the group's rounded remainder sum is
+    handed out, one unit each, to the values with the largest remainders. Ties
+    are broken by position, like `pd.Series.nlargest`. Groups are processed in
+    parallel, and all columns of a group are rounded in the same pass.
+
+    Args:
+        raw (np.ndarray): 2D float array of unrounded values, rows sorted by group.
+        group_start (np.ndarray): Start row of each group in `raw`.
+        group_end (np.ndarray): End row (exclusive) of each group in `raw`.
+        out (np.ndarray): Int64 array shaped like `raw` receiving the result.
+    """
+    n_columns = raw.shape[1]
+    for g in numba.prange(len(group_start)):
+        start = group_start[g]
+        end = group_end[g]
+        remainder = np.empty(end - start)
+        for c in range(n_columns):
+            for i in range(start, end):
+                floored = np.floor(raw[i, c])
+                out[i, c] = np.int64(floored)
+                remainder[i - start] = raw[i, c] - floored
+
+            # Total the remainders the way `hamilton_floor` does, so that sums
+            # close to x.5 round the same way
+            total = _pairwise_sum(remainder, 0, end - start)
+            n_extra = np.int64(np.rint(total))
+            if n_extra > 0:
+                # A stable sort keeps the first of equal remainders ahead
+                top = np.argsort(-remainder, kind="mergesort")[:n_extra]
+                for j in top:
+                    out[start + j, c] += 1
+
+
+@numba.njit(nogil=True, cache=True)
+def group_sum(group_codes, values, n_groups):
+    """
+    Sums the rows of `values` that share a group code.
+
+    Runs as a single serial pass over the rows, adding every column of a row
+    at once.
+
+    Args:
+        group_codes (np.ndarray): Group code in [0, n_groups) of each row.
+        values (np.ndarray): 2D array of values to sum, one row per code.
+        n_groups (int): Number of groups.
+
+    Returns:
+        np.ndarray: Array of shape (n_groups, values.shape[1]) with the group sums.
+    """
+    out = np.zeros((n_groups, values.shape[1]), dtype=values.dtype)
+    for i in range(len(group_codes)):
+        for c in range(values.shape[1]):
+            out[group_codes[i], c] += values[i, c]
+    return out
@@ -1,12 +1,258 @@
 import sys
 import yaml
+import warnings
+import logging
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import networkx as nx
+import shapely
 import geopandas as gpd
 from .harvest import Harvest
+from ._kernels import group_sum, hamilton_floor_sorted
 import importlib.resources
 from gerrychain import Graph
+from gerrychain.graph.geo import GeometryError
+
+log = logging.getLogger(__name__)
+
+# Opt-in console output that keeps status messages on a single line
+_status_handler = logging.StreamHandler(sys.stdout)
+_status_handler.terminator = ""
+_status_handler.setFormatter(logging.Formatter("\r%(message)-100s"))
+
+# Level of the logger before the status handler was attached
+_level_before_verbose = None
+
+
+def _set_verbose(verbose: bool):
+    """
+    Attaches the status handler and lowers the logger to INFO, or detaches
+    the handler and restores the previous level. Each `Cultivate` applies its
+    own `verbose` flag, so a quiet instance undoes a verbose one.
+    """
+    global _level_before_verbose
+    attached = _status_handler in log.handlers
+    if verbose and not attached:
+        _level_before_verbose = log.level
+        log.addHandler(_status_handler)
+        log.setLevel(logging.INFO)
+    elif not verbose and attached:
+        log.removeHandler(_status_handler)
+        log.setLevel(_level_before_verbose)
+
+
+def _hamilton_by_group(raw: np.ndarray, group_codes: np.ndarray) -> np.ndarray:
+    """
+    Applies Hamilton rounding to each column of `raw` within each group.
+
+    Equivalent to calling `Cultivate.hamilton_floor` on every group of every
+    column of `raw` defined by `group_codes`, but runs as a single compiled
+    kernel over the group-sorted rows instead of a Python callback per group.
+
+    Args:
+        raw (np.ndarray): 2D array of unrounded values, one column per series.
+        group_codes (np.ndarray): Integer group code of each row, as returned
+            by `pd.factorize`.
+
+    Returns:
+        np.ndarray: Rounded integer values shaped like `raw`, in the original order.
+    """
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(group_codes))))
+
+    # `pd.factorize` numbers groups in order of first appearance, so rows that
+    # are already grouped have non-decreasing codes and need no reordering
+    if np.all(group_codes[1:] >= group_codes[:-1]):
+        order = None
+    else:
+        order = np.argsort(group_codes, kind="stable")
+        raw = raw[order]
+
+    rounded = np.empty(raw.shape, dtype=np.int64)
+    hamilton_floor_sorted(
+        np.ascontiguousarray(raw, dtype=np.float64),
+        bounds[:-1],
+        bounds[1:],
+        rounded,
+    )
+    if order is None:
+        return rounded
+
+    result = np.empty_like(rounded)
+    result[order] = rounded
+    return result
+
+
+def _rook_graph(gdf: gpd.GeoDataFrame) -> Graph:
+    """
+    Builds the rook adjacency graph of a GeoDataFrame.
+
+    Produces the same graph as `Graph.from_geodataframe(gdf)`, with the same
+    `shared_perim`, `area`, `boundary_node` and `boundary_perim` attributes,
+    but finds and measures all candidate pairs with bulk STRtree and Shapely
+    operations instead of one Python-level query per polygon. Like gerrychain,
+    it warns about overlapping polygons.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Valid polygons, indexed by node id.
+
+    Returns:
+        Graph: Adjacency graph with the columns of `gdf` as node attributes.
+
+    Raises:
+        GeometryError: If any geometry is invalid.
+    """
+    invalid = ~gdf.geometry.is_valid.to_numpy()
+    if invalid.any():
+        raise GeometryError(
+            f"Invalid geometries at rows {list(gdf.index[invalid])}. Consider "
+            "repairing the affected geometries with `shapely.make_valid`."
+        )
+
+    geometries = gdf.geometry.to_numpy()
+    nodes = gdf.index.tolist()
+
+    # Candidate pairs are those with intersecting bounding boxes. Keep each
+    # unordered pair once, then measure the boundary the two polygons share.
+    left, right = shapely.STRtree(geometries).query(geometries)
+    keep = (left < right) & ~shapely.is_empty(geometries[right])
+    left, right = left[keep], right[keep]
+    shared = shapely.intersection(geometries[left], geometries[right])
+    shared_perim = shapely.length(shared)
+
+    overlapping = shapely.area(shared) > 0
+    if overlapping.any():
+        overlaps = {
+            frozenset((nodes[i], nodes[j]))
+            for i, j in zip(left[overlapping].tolist(), right[overlapping].tolist())
+        }
+        warnings.warn(
+            f"Found overlaps among the given polygons. Indices of overlaps: {overlaps}"
+        )
+
+    # Rook adjacency requires a shared boundary of positive length
+    rook = shared_perim > 0
+    left, right, shared_perim = left[rook], right[rook], shared_perim[rook]
+
+    # Nodes touching the outer boundary of the union of all polygons get the
+    # part of their perimeter that is not shared with any neighbor
+    boundaries = shapely.boundary(geometries)
+    outer_boundary = shapely.boundary(shapely.union_all(geometries))
+    shapely.prepare(outer_boundary)
+    boundary_node = shapely.intersects(outer_boundary, boundaries)
+    boundary_perim = shapely.length(boundaries) - (
+        np.bincount(left, shared_perim, len(nodes))
+        + np.bincount(right, shared_perim, len(nodes))
+    )
+
+    nx_graph = nx.Graph()
+    for node, is_boundary, perim, area in zip(
+        nodes,
+        boundary_node.tolist(),
+        boundary_perim.tolist(),
+        shapely.area(geometries).tolist(),
+    ):
+        nx_graph.add_node(node, boundary_node=is_boundary, area=area)
+        if is_boundary:
+            nx_graph.nodes[node]["boundary_perim"] = perim
+    nx_graph.add_edges_from(
+        (nodes[i], nodes[j], {"shared_perim": perim})
+        for i, j, perim in zip(left.tolist(), right.tolist(), shared_perim.tolist())
+    )
+    nx_graph.geometry = gdf.geometry
+    nx_graph.graph["crs"] = None if gdf.crs is None else gdf.crs.to_json()
+
+    graph = Graph.from_networkx(nx_graph)
+    graph.add_data(gdf)
+    graph.issue_warnings()
+    return graph
+
+
+def _pad_geoids(keys, width: int) -> pd.arrays.ArrowStringArray:
+    """
+    Formats GEOID keys as zero-padded strings of a fixed width.
+
+    Restores the leading zero lost when GEOIDs are loaded as numbers. Keys may
+    be integers or digit strings, and are padded by a single Arrow kernel
+    rather than element by element.
+
+    Args:
+        keys (array-like): Integer or string GEOID keys.
+        width (int): Number of digits in a GEOID of the level.
+
+    Returns:
+        pd.arrays.ArrowStringArray: Zero-padded GEOID strings.
+    """
+    digits = pa.array(keys).cast(pa.string())
+    return pd.arrays.ArrowStringArray(pc.utf8_lpad(digits, width, "0"))
+
+
+# Block keys are numeric GEOIDs (the leading zero of the state FIPS is lost on
+# load), so the GEOID of each coarser level is the key with trailing digits
+# removed.
+_LEVEL_DIVISORS = {
+    "block": 1,
+    "blockgroup": 10**3,
+    "tract": 10**4,
+    "county": 10**10,
+}
+
+# Number of digits in the GEOID of each level, including the state FIPS
+_GEOID_WIDTHS = {
+    "block": 15,
+    "blockgroup": 12,
+    "tract": 11,
+    "county": 5,
+}
+
+
+# Manual adjacencies for islands and other units that share no boundary with
+# the mainland, as pairs of block group GEOID20s
+_DEFAULT_CUSTOM_EDGES = (
+    # Named connections
+    ("060759804011", "060750604002"),  # Farallon Islands ↔ Port
+    ("060750179032", "060750101011"),  # Alcatraz ↔ Pier 39
+    ("060750615072", "060750179031"),  # Example connection
+    # Channel islands
+    ("060839801001", "061110025003"),  # Channel 0 ↔ Ventura Harbor
+    ("061110036181", "061110036172"),  # Channel 1 ↔ Shared port
+    ("061119800001", "061110036172"),  # Channel 2 ↔ Shared port
+    ("060375991001", "060375990001"),  # Channel 3 ↔ 5
+    ("060375991001", "060375991002"),  # Channel 3 ↔ 4
+    ("060375990001", "060375760011"),  # Channel 5 ↔ Port 1
+    ("060375990001", "060379800311"),  # Channel 5 ↔ Port 2
+    ("060375990001", "061110025003"),  # Channel 5 ↔ Ventura Harbor
+    # More manual connections
+    ("060730050001", "060730110001"),
+    ("060014272005", "060014060001"),
+    ("060730101091", "060730102011"),
+    ("060590995143", "060590995141"),
+    ("060590995145", "060590995141"),
+    ("060375775011", "060375776041"),
+    ("060590630051", "060590630061"),
+    ("060590635001", "060590629001"),
+)
+
+
+class _Input:
+    """
+    Input frame of a `Cultivate`. Assigning a new frame clears the results
+    that `Cultivate` caches from its inputs, so they are computed again.
+    Editing the frame in place goes unnoticed and keeps the cached results.
+    """
+
+    def __set_name__(self, owner, name):
+        self.attribute = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.attribute)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.attribute, value)
+        instance._clear_cache()
 
 
 class Cultivate:
@@ -21,6 +267,13 @@ class Cultivate:
             precinct keys and vote counts for Democratic and Republican candidates.
         conversion_df (pd.DataFrame): DataFrame containing conversion data mapping precinct
             keys to census block keys, along with registration data.
+        census_df (pd.DataFrame): DataFrame containing block populations.
+        shapefile_df (gpd.GeoDataFrame): GeoDataFrame containing block group shapes.
+
+        Results derived from these frames are cached. Assigning a new frame to any of
+        them clears the cache. Changes made to a frame in place, such as
+        `c.election_df.loc[...] = ...`, are not detected and leave stale results in
+        the cache; reassign the frame (`c.election_df = df`) after editing it.
 
     Methods:
         __init__(election_file: str, conversion_file: str):
@@ -31,6 +284,13 @@ class Cultivate:
             Applies Hamilton rounding to a series of values, ensuring that the sum of the
             rounded values matches the sum of the original values.
 
+        _clear_cache():
+            Drops the results cached from the input frames.
+
+        _allocate_votes() -> pd.DataFrame:
+            Allocates precinct votes to census blocks with Hamilton rounding, caching
+            the result for every aggregation level.
+
         blockify(level: str = "blockgroup") -> pd.DataFrame:
             Aggregates precinct-level election data to a specified census geography level
             (e.g., block, blockgroup, tract, or county) and returns the aggregated data.
@@ -39,19 +299,22 @@ class Cultivate:
             Merges population data from a block-level CSV file with geographic shapes from
             a shapefile, returning a GeoDataFrame with population and geometry data.
 
-        graphify(shape_path: str, blockfile_path: str, level: str = "blockgroup", custom_edges: list) -> nx.Graph:
-            Creates a graph representation of the election data aggregated to the specified
-            geographic level, optionally adding custom edges between specified geographic units.
-
-        _add_edge_by_geoid(graph: nx.Graph, gdf: gpd.GeoDataFrame, geoid1: str, geoid2: str):
-            Adds an edge to the graph between two geographic units identified by their GEOID20
-            values, if both units are present in the GeoDataFrame.
+        graphify(level: str = "blockgroup", custom_edges: tuple | None = None) -> nx.Graph:
+            Creates a graph representation of the election data aggregated to block groups,
+            optionally adding custom edges between specified geographic units.
     """
 
+    election_df = _Input()
+    conversion_df = _Input()
+    census_df = _Input()
+    shapefile_df = _Input()
+
     def __init__(
         self,
         year: str = "2022",
         election: str = "governor",
+        verbose: bool = False,
+        refresh: bool = False,
     ):
         """
         Initialize Cultivate.
@@ -59,44 +322,67 @@ class Cultivate:
         Args:
             year (str, optional): Year to fetch if files are not provided. Defaults to "2022".
             election:
+            verbose (bool, optional): Print progress messages to stdout. Defaults to False.
+                This attaches a stdout handler to the `censusalign.cultivate` logger and
+                sets it to INFO until a `Cultivate` is created with `verbose=False`,
+                which detaches the handler and restores the previous level. Messages
+                still propagate to the root logger as usual.
+            refresh (bool, optional): Download every dataset again instead of using the
+                cached copies. Defaults to False.
         """
+        self._clear_cache()
 
-        self.config = self._load_config(year)
-        harvester = Harvest(year=year)
-        self._print_status(f"Loading election data")
-        self.election_df = harvester.load_vote()
-        self._clear_status()
-        self._print_status(
-            f"Loading conversion data",
-        )
-        self.conversion_df = harvester.load_conversion()
-        self._clear_status()
-        self._print_status(f"Loading census data")
-        self.census_df = harvester.load_census()
-        self._clear_status()
-        self._print_status(f"Loading shapefile data")
-        self.shapefile_df = harvester.load_shapefile()
-        self._clear_status()
+        _set_verbose(verbose)
 
-        self.year = year
+        self.config = self._load_config(year)
 
         # ➔ Pull election columns from config
         election_columns = self.config["election"][election]
 
-        # Always include SRPREC_KEY
-        subset_columns = ["SRPREC_KEY"] + election_columns
+        harvester = Harvest(year=year, refresh=refresh)
+        log.info("Loading election data")
+        # Always include SRPREC_KEY, and only read the columns that are used
+        self.election_df = harvester.load_vote(
+            columns=["SRPREC_KEY"] + election_columns,
+            dtype={column: "int32" for column in election_columns},
+        ).set_axis(["SRPREC_KEY", "dem", "rep"], axis=1)
+        log.info("Loading conversion data")
+        self.conversion_df = harvester.load_conversion(
+            columns=["SRPREC_KEY", "BLOCK_KEY", "BLKREG", "SRTOTREG"]
+        )
+        log.info("Loading census data")
+        self.census_df = harvester.load_census(
+            columns=["BLOCK20", "CIT_22"], dtype={"BLOCK20": "int64"}
+        )
+        log.info("Loading shapefile data")
+        self.shapefile_df = harvester.load_shapefile()
+
+        self.year = year
 
-        # Process election data
-        self.election_df = self.election_df[subset_columns].copy()
-        self.election_df.rename(
-            columns={
-                election_columns[0]: "dem",
-                election_columns[1]: "rep",
-            },
-            inplace=True,
+        # Share one categorical dtype for the precinct key so that merges and
+        # groupbys on it hash small integer codes instead of strings. Precincts
+        # missing from the conversion data can never be matched, so drop them.
+        precinct_dtype = pd.CategoricalDtype(
+            self.conversion_df["SRPREC_KEY"].dropna().unique()
+        )
+        self.conversion_df["SRPREC_KEY"] = self.conversion_df["SRPREC_KEY"].astype(
+            precinct_dtype
+        )
+        self.election_df["SRPREC_KEY"] = self.election_df["SRPREC_KEY"].astype(
+            precinct_dtype
         )
-        self.election_df[["dem", "rep"]] = self.election_df[["dem", "rep"]].astype(int)
-        self._print_status("All data loaded successfully!")
+        self.election_df.dropna(subset=["SRPREC_KEY"], inplace=True)
+        # Keep each precinct's conversion rows together, in their original
+        # order, so Hamilton rounding can walk the groups without a re-sort
+        self.conversion_df = self.conversion_df.sort_values(
+            "SRPREC_KEY", kind="stable", ignore_index=True
+        )
+        log.info("All data loaded successfully!")
+
+    def _clear_cache(self):
+        self._block_votes = None
+        self._population_geometry = None
+        self._blockify_results = {}
 
     def _load_config(self, year):
         yaml_file = importlib.resources.files("censusalign.config").joinpath(
@@ -117,63 +403,117 @@ class Cultivate:
             floored.loc[top_indices] += 1
         return floored
 
-    def blockify(self, level: str = "blockgroup") -> pd.DataFrame:
+    def _allocate_votes(self) -> pd.DataFrame:
         """
-        Aggregates precinct-level election data to specified census geography.
+        Allocates precinct votes to census blocks with Hamilton rounding.
 
-        Args:
-            race (str): Type of election data to process.
-
-            level (str): Aggregation level.
-                One of 'block', 'blockgroup', 'tract', or 'county'.
+        The allocation does not depend on the aggregation level, so it is
+        computed on the first call and reused by every later `blockify` until
+        an input frame is reassigned.
 
         Returns:
-            pd.DataFrame: Aggregated DataFrame with columns [GEOID_<LEVEL>, tot, dem, rep].
+            pd.DataFrame: DataFrame with one row per precinct and land block pair
+                and columns [BLOCK_KEY, dem, rep].
         """
-        # Merge election and conversion data
-        merged = self.conversion_df.merge(self.election_df, on="SRPREC_KEY", how="left")
-
-        # Drop rows with missing or zero registration data
-        merged = merged.dropna(subset=["BLKREG", "SRTOTREG", "dem", "rep"])
-        merged = merged[merged["SRTOTREG"] > 0]
+        if self._block_votes is not None:
+            return self._block_votes
+
+        # Number precincts by one categorical dtype, which the frames already
+        # share unless one was replaced. When every precinct has at most one
+        # election row, each conversion row then finds its votes through a
+        # lookup table on the integer codes instead of a hash merge. Unmatched
+        # rows (code -1 or no election row) get NaN votes.
+        conversion_keys = self.conversion_df["SRPREC_KEY"]
+        precinct_dtype = conversion_keys.dtype
+        if not isinstance(precinct_dtype, pd.CategoricalDtype):
+            precinct_dtype = pd.CategoricalDtype(conversion_keys.dropna().unique())
+        conversion_codes = pd.Categorical(conversion_keys, dtype=precinct_dtype).codes
+        election_codes = pd.Categorical(
+            self.election_df["SRPREC_KEY"], dtype=precinct_dtype
+        ).codes
+        election_rows = np.flatnonzero(election_codes >= 0)
+        election_codes = election_codes[election_rows]
+        n_precincts = len(precinct_dtype.categories)
+        if np.bincount(election_codes, minlength=n_precincts).max(initial=0) <= 1:
+            merged = self.conversion_df
+            election_row = np.full(n_precincts + 1, -1)
+            election_row[election_codes] = election_rows
+            election_row = election_row[conversion_codes]
+            matched = election_row >= 0
+            votes = np.full((len(merged), 2), np.nan)
+            votes[matched] = self.election_df[["dem", "rep"]].to_numpy(
+                dtype=np.float64
+            )[election_row[matched]]
+        else:
+            merged = self.conversion_df.merge(
+                self.election_df, on="SRPREC_KEY", how="left"
+            )
+            votes = merged[["dem", "rep"]].to_numpy(dtype=np.float64)
+        blkreg = merged["BLKREG"].to_numpy(dtype=np.float64)[:, None]
+        srtotreg = merged["SRTOTREG"].to_numpy(dtype=np.float64)[:, None]
 
         # Compute raw proportional allocation
-        merged["dem_raw"] = merged["dem"] * merged["BLKREG"] / merged["SRTOTREG"]
-        merged["rep_raw"] = merged["rep"] * merged["BLKREG"] / merged["SRTOTREG"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw = votes * blkreg / srtotreg
 
-        # Replace any infinite results and drop remaining NaNs
-        merged.replace([np.inf, -np.inf], np.nan, inplace=True)
-        merged.dropna(subset=["dem_raw", "rep_raw"], inplace=True)
+        # Keep rows with positive registration data and a finite allocation in
+        # a single mask, so the merged frame is filtered only once
+        valid = (srtotreg[:, 0] > 0) & np.isfinite(raw).all(axis=1)
+        merged = merged.loc[valid, ["SRPREC_KEY", "BLOCK_KEY"]]
+        raw = raw[valid]
 
         # Apply Hamilton rounding within each precinct
-        merged["dem"] = merged.groupby("SRPREC_KEY")["dem_raw"].transform(
-            self.hamilton_floor
-        )
-        merged["rep"] = merged.groupby("SRPREC_KEY")["rep_raw"].transform(
-            self.hamilton_floor
+        codes, _ = pd.factorize(merged["SRPREC_KEY"], sort=False)
+        rounded = _hamilton_by_group(raw, codes)
+
+        # Remove water-only blocks (block groups ending in '0')
+        block_key = merged["BLOCK_KEY"].to_numpy(dtype=np.int64)
+        land = (block_key // _LEVEL_DIVISORS["blockgroup"]) % 10 != 0
+
+        self._block_votes = pd.DataFrame(
+            {
+                "BLOCK_KEY": block_key[land],
+                "dem": rounded[land, 0],
+                "rep": rounded[land, 1],
+            }
         )
+        return self._block_votes
 
-        # Aggregate to block level
-        block_votes = merged.groupby("BLOCK_KEY")[["dem", "rep"]].sum().reset_index()
-        block_votes["tot"] = block_votes["dem"] + block_votes["rep"]
+    def blockify(self, level: str = "blockgroup") -> pd.DataFrame:
+        """
+        Aggregates precinct-level election data to specified census geography.
 
-        # Remove water-only blocks (block groups ending in '0')
-        block_votes["BLOCK_KEY"] = block_votes["BLOCK_KEY"].astype(str)
-        block_votes["blockgroup"] = block_votes["BLOCK_KEY"].str[:11]
-        block_df = block_votes[block_votes["blockgroup"].str[-1] != "0"].copy()
-        block_df = block_df[["BLOCK_KEY", "tot", "dem", "rep"]].sort_values("BLOCK_KEY")
+        Args:
+            race (str): Type of election data to process.
+
+            level (str): Aggregation level.
+                One of 'block', 'blockgroup', 'tract', or 'county'.
 
+        Returns:
+            pd.DataFrame: Aggregated DataFrame with columns [GEOID_<LEVEL>, tot, dem, rep].
+        """
         geoid_col = f"GEOID_{level}"
         # Handle aggregation level
-        if level == "blockgroup":
-            block_df[geoid_col] = block_df["BLOCK_KEY"].str[:11]
-        else:
+        if level not in _LEVEL_DIVISORS:
             raise ValueError(
-                "Invalid level. Only 'blockgroup', supported at this time."
+                "Invalid level. Must be one of 'block', 'blockgroup', 'tract', or 'county'."
             )
 
-        # Aggregate and return
-        agg = block_df.groupby(geoid_col)[["dem", "rep"]].sum().reset_index()
+        # Each level is aggregated once and memoized until an input frame is
+        # reassigned. Hand out copies so callers cannot alter the cached frame.
+        if level in self._blockify_results:
+            return self._blockify_results[level].copy()
+
+        block_votes = self._allocate_votes()
+
+        # Aggregate straight to the requested level, whose GEOID is a prefix
+        # of the block key
+        block_key = block_votes["BLOCK_KEY"].to_numpy(dtype=np.int64)
+        codes, geoids = pd.factorize(block_key // _LEVEL_DIVISORS[level], sort=True)
+        sums = group_sum(codes, block_votes[["dem", "rep"]].to_numpy(), len(geoids))
+        agg = pd.DataFrame(
+            {geoid_col: geoids.astype(str), "dem": sums[:, 0], "rep": sums[:, 1]}
+        )
         agg["tot"] = agg["dem"] + agg["rep"]
 
         # Rename columns
@@ -182,9 +522,10 @@ class Cultivate:
             inplace=True,
         )
 
-        return agg[[geoid_col, "total_vote", "dem_vote", "rep_vote"]].sort_values(
-            geoid_col
-        )
+        self._blockify_results[level] = agg[
+            [geoid_col, "total_vote", "dem_vote", "rep_vote"]
+        ].sort_values(geoid_col)
+        return self._blockify_results[level].copy()
 
     def merge_population_and_geometry(self) -> gpd.GeoDataFrame:
         """
@@ -192,110 +533,120 @@ class Cultivate:
 
         Returns:
             gpd.GeoDataFrame: A GeoDataFrame containing merged population and geometry data,
-                              with columns ['GEOID20', 'geometry', 'FIPS', 'pop_total'].
+                              sorted by GEOID20, with the shapefile columns except
+                              'STATEFP20' and 'COUNTYFP20' in their original order,
+                              followed by 'FIPS' and 'pop_total'.
         """
-        gdf = self.shapefile_df.copy()
-        block_df = self.census_df.copy()
-
-        gdf["geometry"] = gdf["geometry"].buffer(0)
-        gdf["FIPS"] = gdf["STATEFP20"] + gdf["COUNTYFP20"]
-        gdf.drop(["STATEFP20", "COUNTYFP20"], axis=1, inplace=True)
-
-        block_df["BLOCK20"] = block_df["BLOCK20"].astype(str)
-        block_df["GEOID20"] = block_df["BLOCK20"].str[:11]
-        blockgroup_data = block_df.groupby("GEOID20").sum(numeric_only=True)
-        blockgroup_data = blockgroup_data.reset_index()
+        # Repairing and reprojecting every polygon is expensive, so the result
+        # is memoized until `census_df` or `shapefile_df` is reassigned
+        if self._population_geometry is not None:
+            return self._population_geometry.copy()
+
+        # Only the population column is needed, so sum just that one
+        block_key = self.census_df["BLOCK20"].to_numpy(dtype=np.int64)
+        blockgroup_data = (
+            self.census_df["CIT_22"]
+            .groupby(block_key // _LEVEL_DIVISORS["blockgroup"])
+            .sum()
+            .rename("pop_total")
+            .rename_axis("GEOID20")
+            .reset_index()
+        )
 
-        blockgroup_data["GEOID20"] = "0" + blockgroup_data["GEOID20"]
-        blockgroup_data = blockgroup_data.rename(columns={"CIT_22": "pop_total"})[
-            ["GEOID20", "pop_total"]
-        ]
+        blockgroup_data["GEOID20"] = _pad_geoids(
+            blockgroup_data["GEOID20"], _GEOID_WIDTHS["blockgroup"]
+        )
 
-        gdf = pd.merge(gdf, blockgroup_data, on="GEOID20", how="inner")
+        # Shapes without population data are dropped by the join anyway, so
+        # leave them out before repairing geometries and reprojecting
+        gdf = self.shapefile_df[
+            self.shapefile_df["GEOID20"].isin(blockgroup_data["GEOID20"])
+        ].drop(columns=["STATEFP20", "COUNTYFP20"])
+
+        # Repair only the invalid polygons. Unlike buffer(0), make_valid keeps
+        # every part of a self-intersecting ring instead of dropping some.
+        invalid = ~gdf.geometry.is_valid.to_numpy()
+        if invalid.any():
+            gdf.loc[invalid, "geometry"] = shapely.make_valid(
+                gdf.geometry.to_numpy()[invalid],
+                method="structure",
+                keep_collapsed=False,
+            )
         gdf = gdf.to_crs(3310)
-        return gdf.sort_values(by="GEOID20").reset_index(drop=True)
+        # The state and county FIPS codes are the first digits of the GEOID
+        gdf["FIPS"] = gdf["GEOID20"].str.slice(0, _GEOID_WIDTHS["county"])
+
+        # Join on sorted, unique GEOID20 indexes so pandas can take its
+        # monotonic merge-join path instead of building a hash table, then
+        # put GEOID20 back in its place among the shapefile columns
+        columns = [*gdf.columns, "pop_total"]
+        gdf = (
+            gdf.set_index("GEOID20")
+            .sort_index()
+            .join(blockgroup_data.set_index("GEOID20"), how="inner")
+            .reset_index()[columns]
+        )
+        self._population_geometry = gdf
+        return self._population_geometry.copy()
 
     def graphify(
         self,
         level: str = "blockgroup",
-        custom_edges: list = [
-            # Named connections
-            ("060759804011", "060750604002"),  # Farallon Islands ↔ Port
-            ("060750179032", "060750101011"),  # Alcatraz ↔ Pier 39
-            ("060750615072", "060750179031"),  # Example connection
-            # Channel islands
-            ("060839801001", "061110025003"),  # Channel 0 ↔ Ventura Harbor
-            ("061110036181", "061110036172"),  # Channel 1 ↔ Shared port
-            ("061119800001", "061110036172"),  # Channel 2 ↔ Shared port
-            ("060375991001", "060375990001"),  # Channel 3 ↔ 5
-            ("060375991001", "060375991002"),  # Channel 3 ↔ 4
-            ("060375990001", "060375760011"),  # Channel 5 ↔ Port 1
-            ("060375990001", "060379800311"),  # Channel 5 ↔ Port 2
-            ("060375990001", "061110025003"),  # Channel 5 ↔ Ventura Harbor
-            # More manual connections
-            ("060730050001", "060730110001"),
-            ("060014272005", "060014060001"),
-            ("060730101091", "060730102011"),
-            ("060590995143", "060590995141"),
-            ("060590995145", "060590995141"),
-            ("060375775011", "060375776041"),
-            ("060590630051", "060590630061"),
-            ("060590635001", "060590629001"),
-        ],
+        custom_edges: tuple | None = None,
     ) -> nx.Graph:
         """
         Creates a GeoDataFrame with election data aggregated to the specified level.
 
         Args:
-            level (str): Aggregation level. One of 'block', 'blockgroup', 'tract', or 'county'.
+            level (str): Aggregation level. Only 'blockgroup' is supported, as the
+                shapefile holds block group shapes.
+            custom_edges (tuple, optional): Pairs of GEOID20s to connect in addition to the
+                computed adjacencies. Defaults to the built-in California island connections;
+                pass an empty tuple to add none.
 
         Returns:
             An nx.Graph object representing the election data at the specified level.
+
+        Raises:
+            ValueError: If the level is not 'blockgroup'.
         """
-        self._print_status(f"Blockifying election data")
+        if level != "blockgroup":
+            raise ValueError(
+                "Invalid level. Only 'blockgroup' is supported for graphs."
+            )
+
+        log.info("Blockifying election data")
         vote_by_block_df = self.blockify(level="blockgroup")
-        geoid_col = f"GEOID_{level}"
-        vote_by_block_df.rename(columns={geoid_col: "GEOID20"}, inplace=True)
-        vote_by_block_df["GEOID20"] = "0" + vote_by_block_df["GEOID20"]
-        self._clear_status()
-        self._print_status(f"Merging population and geometry data")
+        vote_by_block_df.rename(columns={"GEOID_blockgroup": "GEOID20"}, inplace=True)
+        vote_by_block_df["GEOID20"] = _pad_geoids(
+            vote_by_block_df["GEOID20"], _GEOID_WIDTHS["blockgroup"]
+        )
+        log.info("Merging population and geometry data")
         gdf = self.merge_population_and_geometry()
-        gdf = pd.merge(
-            gdf,
-            vote_by_block_df,
-            on="GEOID20",
-            how="inner",
+        # Both frames are sorted by GEOID20, so this is a monotonic index join
+        gdf = (
+            gdf.set_index("GEOID20")
+            .join(vote_by_block_df.set_index("GEOID20"), how="inner")
+            .reset_index()
         )
-        self._clear_status()
 
-        graph = Graph.from_geodataframe(gdf, ignore_errors=False)
-        for geoid1, geoid2 in custom_edges:
-            self._add_edge_by_geoid(graph, gdf, geoid1, geoid2)
+        graph = _rook_graph(gdf)
+
+        edges = _DEFAULT_CUSTOM_EDGES if custom_edges is None else custom_edges
+        if edges:
+            # Map each GEOID20 to its node once and add every custom edge whose
+            # endpoints are both present in a single call
+            geoid_to_index = dict(zip(gdf["GEOID20"], gdf.index))
+            resolved = []
+            for geoid1, geoid2 in edges:
+                index1 = geoid_to_index.get(geoid1)
+                index2 = geoid_to_index.get(geoid2)
+                if index1 is None or index2 is None:
+                    log.debug(
+                        "One of the GEOIDs %s, %s not found in gdf", geoid1, geoid2
+                    )
+                    continue
+                resolved.append((index1, index2))
+            graph.add_edges_from(resolved)
 
         return graph
-
-    def _add_edge_by_geoid(self, graph, gdf, geoid1, geoid2, warnings=False):
-        """Add edge to the graph using GEOID20 values."""
-        try:
-            index1 = gdf.index[gdf["GEOID20"] == geoid1].tolist()[0]
-            index2 = gdf.index[gdf["GEOID20"] == geoid2].tolist()[0]
-            graph.add_edge(index1, index2)
-        except IndexError:
-            if warnings:
-                print(
-                    f"Warning: One of the GEOIDs {geoid1}, {geoid2} not found in gdf."
-                )
-
-    def _print_status(self, message: str):
-        """
-        Print a status message that stays on the same line.
-        """
-        sys.stdout.write(f"\r{message}")
-        sys.stdout.flush()
-
-    def _clear_status(self):
-        """
-        Clear the current line from the terminal.
-        """
-        sys.stdout.write("\r" + " " * 100 + "\r")
-        sys.stdout.flush()
@@ -1,12 +1,39 @@
 import os
 import yaml
+import hashlib
 import requests
+import shutil
 import zipfile
 import tempfile
 import pandas as pd
-from io import BytesIO
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pyogrio
 import geopandas as gpd
 import importlib.resources
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
+
+# Keep text columns in Arrow memory instead of converting them to Python objects
+_ARROW_STRING_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+}
+
+# Seconds to wait for the server to connect or send more data
+_TIMEOUT = 60
+
+# Seconds to wait for the validator probe before falling back to the cache
+_PROBE_TIMEOUT = 5
+
+# File extension written for each supported vector driver
+_DRIVER_EXTENSIONS = {
+    "ESRI Shapefile": ".shp",
+    "GPKG": ".gpkg",
+}
 
 
 class Harvest:
@@ -23,35 +50,71 @@ class Harvest:
         conversion_url (str): URL for the conversion data.
         census_url (str): URL for the census data.
         shapefile_url (str): URL for the shapefile data.
+        cache_dir (str): Directory where parsed tables are cached as Parquet files.
+        refresh (bool): Whether cached copies are ignored and replaced.
+        session (requests.Session): HTTP session shared by all downloads.
+        probe_session (requests.Session): HTTP session for the cache validator probes,
+            which are not retried.
 
     Methods:
-        load_vote() -> pd.DataFrame:
+        fetch_and_store(out_dir: str, driver: str = "ESRI Shapefile"):
+            Fetch every dataset and write it to local files.
+
+        load_vote(columns: list = None, dtype: dict = None) -> pd.DataFrame:
             Fetch and load the vote data as a pandas DataFrame.
 
-        load_conversion() -> pd.DataFrame:
+        load_conversion(columns: list = None, dtype: dict = None) -> pd.DataFrame:
             Fetch and load the conversion data as a pandas DataFrame.
 
-        load_census() -> pd.DataFrame:
+        load_census(columns: list = None, dtype: dict = None) -> pd.DataFrame:
             Fetch and load the census data as a pandas DataFrame.
 
-        load_shapefile() -> pd.DataFrame:
+        load_shapefile(columns: list = None) -> gpd.GeoDataFrame:
             Fetch and load the shapefile data as a pandas DataFrame.
 
     Private Methods:
         _load_yaml(path: str) -> dict:
             Load and parse a YAML configuration file.
 
-        _load(data_url: str) -> pd.DataFrame:
+        _load(data_url: str, columns: list = None, dtype: dict = None) -> pd.DataFrame:
+            Load a table from the Parquet cache, fetching and caching it on a miss.
+
+        _fetch(data_url: str) -> pd.DataFrame:
             Fetch data from a URL, extract it if compressed, and load it into a pandas DataFrame.
 
+        _download(data_url: str, path: str) -> bool:
+            Stream a URL to a local file and report whether it is a zip archive.
+
+        _download_cached(data_url: str) -> str:
+            Download a URL into the cache directory unless the cached copy is current.
+
+        _remote_validator(data_url: str) -> str | None:
+            Fetch the ETag or Last-Modified date of a URL with a HEAD request.
+
+        _is_current(path: str, validator: str | None) -> bool:
+            Check whether a cache entry matches the server's validator.
+
+        _store_validator(path: str, validator: str | None):
+            Record the validator of a freshly written cache entry.
+
+        _cache_path(data_url: str, suffix: str) -> str:
+            Build the cache file path for a URL.
+
+        _read_csv(f) -> pd.DataFrame:
+            Parse a comma- or tab-delimited file object into a pandas DataFrame.
+
     """
 
-    def __init__(self, year=2022):
+    def __init__(self, year=2022, cache_dir=None, refresh=False):
         """
         Initialize the Fetch object using a key from the YAML config.
 
         Args:
             year (int): The year for which to fetch data. Default is 2022.
+            cache_dir (str, optional): Directory for cached downloads. Defaults to
+                "~/.cache/censusalign".
+            refresh (bool, optional): Download and parse every dataset again,
+                replacing any cached copies. Defaults to False.
 
         Raises:
             ValueError: If the year is not 2022.
@@ -69,6 +132,28 @@ class Harvest:
         self.census_url = self.config["census_url"]
         self.shapefile_url = self.config["shapefile_url"]
 
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.expanduser("~"), ".cache", "censusalign"
+        )
+        self.refresh = refresh
+
+        # Share one connection pool across downloads, sized for the parallel
+        # fetches in fetch_and_store, and retry transient failures with
+        # backoff. No connection is opened until the first request.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Probe cache validators without retries, so an offline run falls back
+        # to the cache after one short attempt instead of after the backoff
+        self.probe_session = requests.Session()
+
     def _load_config(self, year):
         yaml_file = importlib.resources.files("censusalign.config").joinpath(
             f"ca_{year}.yaml"
@@ -76,132 +161,281 @@ class Harvest:
         with yaml_file.open("r", encoding="utf-8") as f:
             return yaml.safe_load(f)
 
-    def fetch_and_store(self, out_dir: str):
+    def fetch_and_store(self, out_dir: str, driver: str = "ESRI Shapefile"):
         """
         Fetches the data from the URLs specified in the YAML config and stores them as local files.
         The files are saved in the specified output directory, which is created if it doesn't exist.
 
         Args:
             out_dir (str): The directory where the data files will be stored.
+            driver (str, optional): Format to write the shapefile data in, either
+                "ESRI Shapefile" or "GPKG". Defaults to "ESRI Shapefile".
+
+        Raises:
+            ValueError: If the driver is not supported.
         """
+        if driver not in _DRIVER_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported driver: {driver}. Choose from {list(_DRIVER_EXTENSIONS)}."
+            )
         os.makedirs(out_dir, exist_ok=True)
 
-        vote_df = self.load_vote()
-        conversion_df = self.load_conversion()
-        census_df = self.load_census()
-        shapefile_gdf = self.load_shapefile()
-
-        vote_df.to_csv(os.path.join(out_dir, f"vote_data_{self.year}.csv"), index=False)
-        conversion_df.to_csv(
-            os.path.join(out_dir, f"conversion_data_{self.year}.csv"),
-            index=False,
-        )
-        census_df.to_csv(
-            os.path.join(out_dir, f"census_data_{self.year}.csv"), index=False
-        )
-        shapefile_gdf.to_file(os.path.join(out_dir, f"shapefile_data_{self.year}.shp"))
-
-    def load_vote(self) -> pd.DataFrame:
+        def store_csv(load, name):
+            load().to_csv(
+                os.path.join(out_dir, f"{name}_data_{self.year}.csv"), index=False
+            )
+
+        def store_shapefile():
+            # Write through GDAL's Arrow stream in bulk rather than record by record
+            pyogrio.write_dataframe(
+                self.load_shapefile(),
+                os.path.join(
+                    out_dir,
+                    f"shapefile_data_{self.year}{_DRIVER_EXTENSIONS[driver]}",
+                ),
+                driver=driver,
+                use_arrow=True,
+            )
+
+        # The datasets are independent and mostly wait on the network, so
+        # fetch and write each one in its own thread
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(store_csv, self.load_vote, "vote"),
+                executor.submit(store_csv, self.load_conversion, "conversion"),
+                executor.submit(store_csv, self.load_census, "census"),
+                executor.submit(store_shapefile),
+            ]
+            # Re-raise the first failure, if any
+            for future in futures:
+                future.result()
+
+    def load_vote(self, columns=None, dtype=None) -> pd.DataFrame:
         """
         Load the vote data from the URL specified in the YAML config.
 
+        Args:
+            columns (list, optional): Columns to load. Defaults to all columns.
+            dtype (dict, optional): Mapping of column names to the dtypes to load
+                them as. Defaults to the inferred dtypes.
+
         Returns:
             pd.DataFrame: DataFrame containing the vote data.
         """
-        return self._load(self.vote_url)
+        return self._load(self.vote_url, columns=columns, dtype=dtype)
 
-    def load_conversion(self) -> pd.DataFrame:
+    def load_conversion(self, columns=None, dtype=None) -> pd.DataFrame:
         """
         Load the conversion data from the URL specified in the YAML config.
 
+        Args:
+            columns (list, optional): Columns to load. Defaults to all columns.
+            dtype (dict, optional): Mapping of column names to the dtypes to load
+                them as. Defaults to the inferred dtypes.
+
         Returns:
             pd.DataFrame: DataFrame containing the conversion data.
         """
-        return self._load(self.conversion_url)
+        return self._load(self.conversion_url, columns=columns, dtype=dtype)
 
-    def load_census(self) -> pd.DataFrame:
+    def load_census(self, columns=None, dtype=None) -> pd.DataFrame:
         """
         Load the census data from the URL specified in the YAML config.
 
+        Args:
+            columns (list, optional): Columns to load. Defaults to all columns.
+            dtype (dict, optional): Mapping of column names to the dtypes to load
+                them as. Defaults to the inferred dtypes.
+
         Returns:
             pd.DataFrame: DataFrame containing the census data.
         """
-        return self._load(self.census_url)
+        return self._load(self.census_url, columns=columns, dtype=dtype)
 
-    def load_shapefile(self) -> gpd.GeoDataFrame:
+    def load_shapefile(self, columns=None) -> gpd.GeoDataFrame:
         """
         Load the shapefile data from the URL specified in the YAML config.
 
+        Args:
+            columns (list, optional): Attribute columns to load in addition to the
+                geometry. Defaults to all columns.
+
         Returns:
             gpd.GeoDataFrame: GeoDataFrame containing the shapefile data.
         """
-        response = requests.get(self.shapefile_url)
-        response.raise_for_status()
-
-        content_type = response.headers.get("Content-Type", "")
-
-        if "zip" in content_type or response.content[:4] == b"PK\x03\x04":
-            # It's a zip archive
-            with tempfile.TemporaryDirectory() as tmpdir:
-                zip_path = os.path.join(tmpdir, "shapefile.zip")
-                with open(zip_path, "wb") as f:
-                    f.write(response.content)
-
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(tmpdir)
-                    extracted_files = zip_ref.namelist()
-
-                # Look for a .shp file
-                shp_file = next(
-                    (f for f in extracted_files if f.endswith(".shp")), None
-                )
-                if not shp_file:
-                    raise FileNotFoundError("No .shp file found in the archive.")
-
-                full_path = os.path.join(tmpdir, shp_file)
-                return gpd.read_file(full_path)
-
-        else:
+        zip_path = self._download_cached(self.shapefile_url)
+        if not zipfile.is_zipfile(zip_path):
             raise ValueError("Expected a zip archive containing shapefile components.")
 
+        # Look for a .shp file without extracting the archive
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            shp_file = next((f for f in zip_ref.namelist() if f.endswith(".shp")), None)
+        if not shp_file:
+            raise FileNotFoundError("No .shp file found in the archive.")
+
+        # GDAL reads the shapefile components straight out of the zip through
+        # its virtual filesystem. Read through pyogrio's Arrow path in bulk,
+        # only materializing the requested columns
+        return gpd.read_file(
+            f"/vsizip/{zip_path}/{shp_file}",
+            engine="pyogrio",
+            use_arrow=True,
+            columns=columns,
+            arrow_to_pandas_kwargs={"types_mapper": _ARROW_STRING_TYPES.get},
+        )
+
     def _load_yaml(self, path: str) -> dict:
         with open(path, "r") as f:
             return yaml.safe_load(f)
 
-    def _load(self, data_url: str) -> pd.DataFrame:
-        response = requests.get(data_url)
-        response.raise_for_status()
-
-        # First, check if the response looks like a zip file
-        content_type = response.headers.get("Content-Type", "")
-
-        if "zip" in content_type or response.content[:4] == b"PK\x03\x04":
-            # It's a zip file
-            with tempfile.TemporaryDirectory() as tmpdir:
-                zip_path = os.path.join(tmpdir, "data.zip")
-                with open(zip_path, "wb") as f:
-                    f.write(response.content)
-
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(tmpdir)
-                    extracted_files = zip_ref.namelist()
+    def _cache_path(self, data_url: str, suffix: str) -> str:
+        url_hash = hashlib.sha256(data_url.encode("utf-8")).hexdigest()[:16]
+        name = os.path.basename(urlparse(data_url).path)
+        return os.path.join(self.cache_dir, f"{url_hash}_{name}{suffix}")
+
+    def _load(self, data_url: str, columns=None, dtype=None) -> pd.DataFrame:
+        # Parsed tables are kept as Parquet so later runs skip the download and
+        # the CSV parse entirely, and only read the requested columns
+        parquet_path = self._cache_path(data_url, ".parquet")
+        validator = self._remote_validator(data_url)
+        if self._is_current(parquet_path, validator):
+            # Map text columns to pyarrow-backed strings, like a fresh parse
+            # does, rather than the default string storage of pd.read_parquet
+            df = pq.read_table(parquet_path, columns=columns).to_pandas(
+                types_mapper=_ARROW_STRING_TYPES.get
+            )
+        else:
+            # The cache holds the full table, so every column is parsed once
+            df = self._fetch(data_url)
 
-                data_file = next(
-                    (f for f in extracted_files if f.endswith((".csv", ".txt"))), None
-                )
-                if not data_file:
-                    raise FileNotFoundError("No CSV or TXT file found in the archive.")
+            # Write to a temporary file first so an interrupted run leaves no
+            # truncated cache entry behind
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = parquet_path + ".tmp"
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+            os.replace(tmp_path, parquet_path)
+            self._store_validator(parquet_path, validator)
 
-                full_path = os.path.join(tmpdir, data_file)
+            if columns is not None:
+                df = df[columns]
 
-                try:
-                    return pd.read_csv(full_path)
-                except pd.errors.ParserError:
-                    return pd.read_csv(full_path, delimiter="\t")
+        return df.astype(dtype) if dtype else df
 
-        else:
-            # It's a raw CSV or TXT file, not zipped
-            try:
-                return pd.read_csv(BytesIO(response.content))
-            except pd.errors.ParserError:
-                return pd.read_csv(BytesIO(response.content), delimiter="\t")
+    def _remote_validator(self, data_url: str) -> str | None:
+        """
+        Ask the server for the ETag (or Last-Modified date) of a URL with a HEAD
+        request. Returns None if the server reports neither, or if the request
+        fails, for instance because the server is unreachable or rejects HEAD.
+        """
+        try:
+            response = self.probe_session.head(
+                data_url, allow_redirects=True, timeout=_PROBE_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            return None
+        return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+    def _is_current(self, path: str, validator: str | None) -> bool:
+        """
+        Whether the cache entry at `path` can be reused. An entry is reused
+        unless the server reported a validator that differs from the one stored
+        when the entry was written. Without a validator to compare, the entry
+        is trusted. With `refresh` set, no entry is reused.
+        """
+        if self.refresh or not os.path.exists(path):
+            return False
+        if validator is None:
+            return True
+        try:
+            with open(path + ".validator", "r") as f:
+                return f.read() == validator
+        except FileNotFoundError:
+            return False
+
+    def _store_validator(self, path: str, validator: str | None):
+        with open(path + ".validator", "w") as f:
+            f.write(validator or "")
+
+    def _download(self, data_url: str, path: str) -> bool:
+        """
+        Stream a URL to `path` in 1 MiB chunks, so the body is never held in
+        memory. Returns whether the download is a zip archive.
+        """
+        with self.session.get(data_url, stream=True, timeout=_TIMEOUT) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            response.raw.decode_content = True
+            with open(path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
+
+        with open(path, "rb") as f:
+            magic = f.read(4)
+        return "zip" in content_type or magic == b"PK\x03\x04"
+
+    def _download_cached(self, data_url: str) -> str:
+        """
+        Download a URL into the cache directory and return the local path. A
+        cached copy is reused while the server reports the same ETag (or
+        Last-Modified date) as when it was downloaded, or when the server
+        cannot be asked.
+        """
+        path = self._cache_path(data_url, "")
+        validator = self._remote_validator(data_url)
+        if self._is_current(path, validator):
+            return path
+
+        # Download next to the cache entry and move it into place, so an
+        # interrupted run never leaves a truncated archive behind
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = path + ".tmp"
+        self._download(data_url, tmp_path)
+        os.replace(tmp_path, path)
+        self._store_validator(path, validator)
+        return path
+
+    def _fetch(self, data_url: str) -> pd.DataFrame:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data")
+
+            if self._download(data_url, path):
+                # It's a zip file, read the data file straight out of the archive
+                with zipfile.ZipFile(path, "r") as zip_ref:
+                    data_file = next(
+                        (f for f in zip_ref.namelist() if f.endswith((".csv", ".txt"))),
+                        None,
+                    )
+                    if not data_file:
+                        raise FileNotFoundError(
+                            "No CSV or TXT file found in the archive."
+                        )
+
+                    with zip_ref.open(data_file) as f:
+                        return self._read_csv(f)
+
+            else:
+                # It's a raw CSV or TXT file, not zipped
+                with open(path, "rb") as f:
+                    return self._read_csv(f)
+
+    def _read_csv(self, f) -> pd.DataFrame:
+        """
+        Parse a comma- or tab-delimited file with the multithreaded pyarrow reader.
+        Text columns come back as pyarrow-backed strings.
+        """
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+        try:
+            table = pa_csv.read_csv(f, convert_options=convert_options)
+            # A tab-delimited file can parse cleanly as a single comma column;
+            # catch that here rather than caching the misread table
+            tab_delimited = table.num_columns == 1 and "\t" in table.column_names[0]
+        except pa.ArrowInvalid:
+            tab_delimited = True
+        if tab_delimited:
+            f.seek(0)
+            table = pa_csv.read_csv(
+                f,
+                parse_options=pa_csv.ParseOptions(delimiter="\t"),
+                convert_options=convert_options,
+            )
+        return table.to_pandas(types_mapper=_ARROW_STRING_TYPES.get)
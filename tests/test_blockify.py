@@ -0,0 +1,210 @@
+import functools
+import io
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from censusalign import cultivate
+from censusalign.cultivate import Cultivate
+
+
+def _make_inputs(seed, n_precincts=200, n_rows=5000):
+    """Election and conversion tables shaped like the statewide files, with
+    water blocks, missing registration and precincts without votes."""
+    rng = np.random.default_rng(seed)
+    precincts = np.array(
+        [f"06{rng.integers(1, 100):03d}{i:05d}" for i in range(n_precincts)]
+    )
+    county = rng.integers(1, 60, n_rows) * 2 + 1
+    tract = rng.integers(100, 120, n_rows)
+    blockgroup = rng.integers(0, 4, n_rows)
+    block = rng.integers(0, 40, n_rows)
+    conversion = pd.DataFrame(
+        {
+            "SRPREC_KEY": rng.choice(precincts, n_rows),
+            "BLOCK_KEY": 6 * 10**13
+            + county * 10**10
+            + tract * 10**4
+            + blockgroup * 1000
+            + block,
+            "BLKREG": rng.integers(0, 50, n_rows).astype(float),
+        }
+    )
+    conversion["SRTOTREG"] = conversion.groupby("SRPREC_KEY")["BLKREG"].transform("sum")
+    conversion.loc[rng.random(n_rows) < 0.02, "BLKREG"] = np.nan
+    election = pd.DataFrame({"SRPREC_KEY": precincts[rng.random(n_precincts) < 0.95]})
+    for column in ["GOVDEM01", "GOVREP01", "SENDEM01", "SENREP01"]:
+        election[column] = rng.integers(0, 2000, len(election))
+    return election, conversion
+
+
+def _reference_blockify(election, conversion, level="blockgroup"):
+    """The original pandas pipeline: merge, per-precinct Hamilton rounding
+    through `hamilton_floor`, then aggregation by GEOID string prefix."""
+    # Digits in the GEOID of each level, without the leading zero of the state
+    prefix_length = {"block": 14, "blockgroup": 11, "tract": 10, "county": 4}[level]
+    election = election.set_axis(["SRPREC_KEY", "dem", "rep"], axis=1)
+
+    merged = conversion.merge(election, on="SRPREC_KEY", how="left")
+    merged = merged.dropna(subset=["BLKREG", "SRTOTREG", "dem", "rep"])
+    merged = merged[merged["SRTOTREG"] > 0]
+    merged["dem_raw"] = merged["dem"] * merged["BLKREG"] / merged["SRTOTREG"]
+    merged["rep_raw"] = merged["rep"] * merged["BLKREG"] / merged["SRTOTREG"]
+    merged.replace([np.inf, -np.inf], np.nan, inplace=True)
+    merged.dropna(subset=["dem_raw", "rep_raw"], inplace=True)
+    merged["dem"] = merged.groupby("SRPREC_KEY")["dem_raw"].transform(
+        Cultivate.hamilton_floor
+    )
+    merged["rep"] = merged.groupby("SRPREC_KEY")["rep_raw"].transform(
+        Cultivate.hamilton_floor
+    )
+
+    block_votes = merged.groupby("BLOCK_KEY")[["dem", "rep"]].sum().reset_index()
+    block_votes["BLOCK_KEY"] = block_votes["BLOCK_KEY"].astype(str)
+    block_df = block_votes[block_votes["BLOCK_KEY"].str[:11].str[-1] != "0"].copy()
+
+    geoid_col = f"GEOID_{level}"
+    block_df[geoid_col] = block_df["BLOCK_KEY"].str[:prefix_length]
+    agg = block_df.groupby(geoid_col)[["dem", "rep"]].sum().reset_index()
+    agg["total_vote"] = agg["dem"] + agg["rep"]
+    agg = agg.rename(columns={"dem": "dem_vote", "rep": "rep_vote"})
+    return agg[[geoid_col, "total_vote", "dem_vote", "rep_vote"]]
+
+
+class _FakeHarvest:
+    """Serves in-memory election and conversion tables through the loading
+    interface of `Harvest`."""
+
+    def __init__(self, tables, **kwargs):
+        self.tables = tables
+
+    def _select(self, name, columns=None, dtype=None):
+        df = self.tables[name]
+        df = df.copy() if columns is None else df[columns].copy()
+        return df.astype(dtype) if dtype else df
+
+    def load_vote(self, columns=None, dtype=None):
+        return self._select("vote", columns, dtype)
+
+    def load_conversion(self, columns=None, dtype=None):
+        return self._select("conversion", columns, dtype)
+
+    def load_census(self, columns=None, dtype=None):
+        return None
+
+    def load_shapefile(self, columns=None):
+        return None
+
+
+@pytest.fixture(params=[0, 1, 2])
+def inputs(request):
+    return _make_inputs(request.param)
+
+
+@pytest.fixture
+def cultivate_from(monkeypatch):
+    """Builds a governor-race `Cultivate` from the given election and
+    conversion tables instead of downloaded ones."""
+
+    def build(election, conversion, **kwargs):
+        tables = {"vote": election, "conversion": conversion}
+        monkeypatch.setattr(
+            cultivate, "Harvest", functools.partial(_FakeHarvest, tables)
+        )
+        return Cultivate(year=2022, **kwargs)
+
+    return build
+
+
+def _assert_matches(result, expected):
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_blockify_matches_reference_with_duplicate_election_rows(
+    inputs, cultivate_from
+):
+    # Repeated precincts take the merge path instead of the code lookup
+    election, conversion = inputs
+    election = pd.concat([election, election.iloc[:7]], ignore_index=True)
+    expected = _reference_blockify(
+        election[["SRPREC_KEY", "GOVDEM01", "GOVREP01"]], conversion
+    )
+    _assert_matches(cultivate_from(election, conversion).blockify(), expected)
+
+
+@pytest.mark.parametrize("level", ["block", "blockgroup", "tract", "county"])
+def test_blockify_matches_reference(inputs, cultivate_from, level):
+    election, conversion = inputs
+    expected = _reference_blockify(
+        election[["SRPREC_KEY", "GOVDEM01", "GOVREP01"]], conversion, level
+    )
+    _assert_matches(cultivate_from(election, conversion).blockify(level), expected)
+
+
+def test_blockify_rejects_unknown_level(inputs, cultivate_from):
+    with pytest.raises(ValueError):
+        cultivate_from(*inputs).blockify("state")
+
+
+@pytest.mark.parametrize("level", ["block", "tract", "county"])
+def test_graphify_rejects_levels_other_than_blockgroup(inputs, cultivate_from, level):
+    with pytest.raises(ValueError):
+        cultivate_from(*inputs).graphify(level)
+
+
+def test_reassigning_election_df_clears_cached_results(inputs, cultivate_from):
+    election, conversion = inputs
+    cultivator = cultivate_from(election, conversion)
+    cultivator.blockify("tract")
+    governor = cultivator.blockify()
+
+    senate_election = election[["SRPREC_KEY", "SENDEM01", "SENREP01"]]
+    cultivator.election_df = senate_election.set_axis(
+        ["SRPREC_KEY", "dem", "rep"], axis=1
+    )
+    senate = cultivator.blockify()
+
+    _assert_matches(senate, _reference_blockify(senate_election, conversion))
+    assert not senate.reset_index(drop=True).equals(governor.reset_index(drop=True))
+
+
+def test_editing_election_df_in_place_keeps_cached_results(inputs, cultivate_from):
+    # A known limitation: only reassignment clears the cache, in-place edits
+    # go unnoticed until the frame is assigned again
+    cultivator = cultivate_from(*inputs)
+    before = cultivator.blockify()
+
+    cultivator.election_df.loc[:, ["dem", "rep"]] = 0
+    pd.testing.assert_frame_equal(cultivator.blockify(), before)
+
+    cultivator.election_df = cultivator.election_df
+    assert (cultivator.blockify()["total_vote"] == 0).all()
+
+
+def test_verbose_flag_is_undone_by_a_quiet_instance(inputs, cultivate_from):
+    logger = cultivate.log
+    logger.setLevel(logging.WARNING)
+    output = io.StringIO()
+    stream = cultivate._status_handler.setStream(output)
+    try:
+        cultivate_from(*inputs, verbose=True)
+        assert cultivate._status_handler in logger.handlers
+        assert logger.level == logging.INFO
+        assert logger.propagate
+        assert "All data loaded" in output.getvalue()
+
+        output.truncate(0)
+        cultivate_from(*inputs, verbose=False)
+        assert cultivate._status_handler not in logger.handlers
+        assert logger.level == logging.WARNING
+        assert output.getvalue() == ""
+    finally:
+        cultivate._status_handler.setStream(stream)
+        logger.removeHandler(cultivate._status_handler)
+        logger.setLevel(logging.NOTSET)
@@ -0,0 +1,140 @@
+import warnings
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from gerrychain import Graph
+from gerrychain.graph.geo import GeometryError
+from shapely import Polygon, box
+
+from censusalign.cultivate import Cultivate, _rook_graph
+
+
+@pytest.fixture
+def grid():
+    """A grid of unit squares with random holes, a detached island and a
+    polygon touching the grid at a single point."""
+    rng = np.random.default_rng(0)
+    geometries = [
+        box(i, j, i + 1, j + 1)
+        for i in range(30)
+        for j in range(30)
+        if rng.random() >= 0.1
+    ]
+    geometries.append(box(100, 100, 101, 101))
+    geometries.append(Polygon([(31, 0), (32, 1), (31, 2), (30.5, 1)]))
+    return gpd.GeoDataFrame(
+        {
+            "pop": rng.integers(0, 10, len(geometries)),
+            "name": [str(k) for k in range(len(geometries))],
+        },
+        geometry=geometries,
+        crs=3310,
+    )
+
+
+def _edges(graph):
+    nx_graph = graph.get_nx_graph()
+    return {frozenset(edge): nx_graph.edges[edge] for edge in nx_graph.edges}
+
+
+def test_rook_graph_matches_from_geodataframe(grid):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = Graph.from_geodataframe(grid, ignore_errors=False)
+        graph = _rook_graph(grid)
+
+    expected_edges, edges = _edges(expected), _edges(graph)
+    assert edges.keys() == expected_edges.keys()
+    for edge, data in expected_edges.items():
+        assert edges[edge]["shared_perim"] == pytest.approx(data["shared_perim"])
+
+    expected_nodes, nodes = expected.get_nx_graph().nodes, graph.get_nx_graph().nodes
+    assert set(nodes) == set(expected_nodes)
+    for node, data in expected_nodes.items():
+        assert nodes[node].keys() == data.keys()
+        for key, value in data.items():
+            if isinstance(value, float):
+                assert nodes[node][key] == pytest.approx(value)
+            elif key != "geometry":
+                assert nodes[node][key] == value
+
+    assert graph.graph["crs"] == expected.graph["crs"]
+    assert graph.geometry.equals(grid.geometry)
+
+
+def test_rook_graph_rejects_invalid_geometries():
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1), (0, 0)])
+    gdf = gpd.GeoDataFrame({"a": [1, 2]}, geometry=[box(2, 0, 3, 1), bowtie])
+    with pytest.raises(GeometryError):
+        _rook_graph(gdf)
+
+
+def test_rook_graph_warns_about_overlaps():
+    gdf = gpd.GeoDataFrame(
+        {"a": [1, 2]}, geometry=[box(0, 0, 1, 1), box(0.5, 0, 1.5, 1)], crs=3310
+    )
+    with pytest.warns(UserWarning, match="overlaps"):
+        _rook_graph(gdf)
+
+
+def _reference_population_geometry(shapefile_df, census_df):
+    """The original merge of block group shapes with block populations."""
+    gdf = shapefile_df.copy()
+    gdf["FIPS"] = gdf["STATEFP20"] + gdf["COUNTYFP20"]
+    gdf = gdf.drop(columns=["STATEFP20", "COUNTYFP20"])
+    blocks = census_df.astype({"BLOCK20": str})
+    blocks["GEOID20"] = "0" + blocks["BLOCK20"].str[:11]
+    populations = (
+        blocks.groupby("GEOID20")["CIT_22"].sum().rename("pop_total").reset_index()
+    )
+    gdf = pd.merge(gdf, populations, on="GEOID20", how="inner").to_crs(3310)
+    return gdf.sort_values(by="GEOID20").reset_index(drop=True)
+
+
+def test_merge_population_and_geometry_matches_reference():
+    rng = np.random.default_rng(0)
+    counties = ["001", "003", "075"]
+    shapes = gpd.GeoDataFrame(
+        {
+            "STATEFP20": "06",
+            "COUNTYFP20": [counties[k % 3] for k in range(30)],
+            "TRACTCE20": [f"{400100 + k:06d}" for k in range(30)],
+            "BLKGRPCE20": [str(1 + k % 4) for k in range(30)],
+        },
+        geometry=[box(k % 6, k // 6, k % 6 + 1, k // 6 + 1) for k in range(30)],
+        crs=4269,
+    ).sample(frac=1, random_state=0)
+    shapes.insert(
+        4,
+        "GEOID20",
+        shapes["STATEFP20"]
+        + shapes["COUNTYFP20"]
+        + shapes["TRACTCE20"]
+        + shapes["BLKGRPCE20"],
+    )
+    shapes.insert(5, "NAMELSAD20", "Block Group " + shapes["BLKGRPCE20"])
+    # Census blocks for all but the last few block groups
+    block_groups = shapes["GEOID20"].str[1:].astype("int64").to_numpy()[:-3]
+    census = pd.DataFrame(
+        {
+            "BLOCK20": np.repeat(block_groups * 1000, 4) + np.tile(np.arange(4), 27),
+            "CIT_22": rng.integers(0, 500, 4 * len(block_groups)),
+        }
+    )
+
+    cultivator = Cultivate.__new__(Cultivate)
+    cultivator.shapefile_df = shapes
+    cultivator.census_df = census
+    result = cultivator.merge_population_and_geometry()
+
+    expected = _reference_population_geometry(shapes, census)
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(result.drop(columns="geometry")),
+        pd.DataFrame(expected.drop(columns="geometry")),
+        check_dtype=False,
+    )
+    assert result.geometry.geom_equals(expected.geometry).all()
+    assert result.crs == expected.crs
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from censusalign._kernels import _pairwise_sum
+from censusalign.cultivate import Cultivate, _hamilton_by_group
+
+
+def _allocations(seed, n_groups=3000):
+    """Proportional vote allocations like `_allocate_votes` produces, with many
+    exact ties and a few precincts larger than NumPy's 128-value sum block."""
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(1, 40, n_groups)
+    sizes[rng.random(n_groups) < 0.02] = rng.integers(129, 400)
+    codes = np.repeat(np.arange(n_groups), sizes)
+    registered = rng.integers(0, 8, len(codes))
+    total = rng.integers(1, 60, n_groups)[codes]
+    votes = rng.integers(0, 500, (len(codes), 2))
+    return votes * registered[:, None] / total[:, None], codes
+
+
+def _reference(raw, codes):
+    return np.column_stack(
+        [
+            pd.Series(raw[:, c])
+            .groupby(codes)
+            .transform(Cultivate.hamilton_floor)
+            .to_numpy()
+            for c in range(raw.shape[1])
+        ]
+    )
+
+
+def test_hamilton_by_group_matches_hamilton_floor():
+    raw, codes = _allocations(2)
+    order = np.random.default_rng(2).permutation(len(codes))
+    raw, codes = raw[order], codes[order]
+    np.testing.assert_array_equal(
+        _hamilton_by_group(raw, codes), _reference(raw, codes)
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_hamilton_by_group_matches_hamilton_floor_contiguous(seed):
+    # Rows already grouped by precinct skip the regrouping sort
+    raw, codes = _allocations(seed)
+    np.testing.assert_array_equal(
+        _hamilton_by_group(raw, codes), _reference(raw, codes)
+    )
+
+
+# Lengths on both sides of the 8-value unroll, the 128-value block and the
+# first splits of NumPy's pairwise summation
+_SUM_LENGTHS = [
+    *range(1, 20),
+    *range(120, 137),
+    *range(248, 265),
+    *range(505, 520),
+    1000,
+    4099,
+]
+
+
+def test_pairwise_sum_matches_numpy():
+    # `hamilton_floor_sorted` totals remainders in NumPy's private pairwise
+    # order to match `hamilton_floor` bit for bit. Values spanning many orders
+    # of magnitude with mixed signs make any change in that order show up.
+    rng = np.random.default_rng(0)
+    order_sensitive = 0
+    for n in _SUM_LENGTHS:
+        for _ in range(5):
+            values = rng.choice([-1.0, 1.0], n + 3) * rng.random(n + 3)
+            values *= 10.0 ** rng.integers(-8, 9, n + 3)
+            assert _pairwise_sum(values, 3, n) == values[3:].sum()
+            order_sensitive += sum(values[3:].tolist()) != values[3:].sum()
+    # Guard against the values becoming too tame to tell the orders apart
+    assert order_sensitive > 0
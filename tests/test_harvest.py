@@ -0,0 +1,235 @@
+import io
+import os
+import zipfile
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+import requests
+from shapely import box
+
+from censusalign import harvest as harvest_module
+from censusalign.harvest import Harvest
+
+
+class _Response:
+    def __init__(self, body=b"", headers=None):
+        self.raw = io.BytesIO(body)
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.raw.close()
+
+
+class _StubSession:
+    """Stands in for `requests.Session`, serving `body` (or the body in
+    `files` for that URL) with an optional ETag and counting the requests it
+    receives."""
+
+    def __init__(self, body=b"", etag=None):
+        self.body = body
+        self.files = {}
+        self.etag = etag
+        self.offline = False
+        self.heads = []
+        self.gets = 0
+
+    def head(self, url, **kwargs):
+        self.heads.append(kwargs)
+        if self.offline:
+            raise requests.ConnectionError("offline")
+        return _Response(headers={"ETag": self.etag} if self.etag else {})
+
+    def get(self, url, **kwargs):
+        self.gets += 1
+        return _Response(self.files.get(url, self.body))
+
+
+@pytest.fixture
+def server():
+    return _StubSession(b"SRPREC_KEY,dem\n0600101,10\n0600102,20\n", etag='"v1"')
+
+
+@pytest.fixture
+def make_harvest(tmp_path, server):
+    def make(refresh=False):
+        harvest = Harvest(cache_dir=str(tmp_path), refresh=refresh)
+        harvest.session = harvest.probe_session = server
+        return harvest
+
+    return make
+
+
+def test_matching_etag_uses_cache(make_harvest, server):
+    make_harvest().load_vote()
+    df = make_harvest().load_vote()
+    assert server.gets == 1
+    assert df["dem"].tolist() == [10, 20]
+
+
+def test_missing_validator_file_refetches(make_harvest, server):
+    harvest = make_harvest()
+    harvest.load_vote()
+    os.remove(harvest._cache_path(harvest.vote_url, ".parquet") + ".validator")
+    make_harvest().load_vote()
+    assert server.gets == 2
+
+
+def test_server_without_validator_trusts_cache(make_harvest, server):
+    make_harvest().load_vote()
+    server.etag = None
+    server.body = b"SRPREC_KEY,dem\n0600101,99\n"
+    df = make_harvest().load_vote()
+    assert server.gets == 1
+    assert df["dem"].tolist() == [10, 20]
+
+
+def test_changed_etag_refetches(make_harvest, server):
+    make_harvest().load_vote()
+    server.etag = '"v2"'
+    server.body = b"SRPREC_KEY,dem\n0600101,99\n"
+    df = make_harvest().load_vote()
+    assert server.gets == 2
+    assert df["dem"].tolist() == [99]
+    # The new ETag is recorded, so the next load is a cache hit again
+    make_harvest().load_vote()
+    assert server.gets == 2
+
+
+def test_refresh_bypasses_cache(make_harvest, server):
+    make_harvest().load_vote()
+    make_harvest(refresh=True).load_vote()
+    assert server.gets == 2
+
+
+def test_offline_probe_is_tried_once_and_falls_back_to_cache(make_harvest, server):
+    make_harvest().load_vote()
+    server.offline = True
+    server.heads.clear()
+    df = make_harvest().load_vote()
+    assert server.gets == 1
+    assert df["dem"].tolist() == [10, 20]
+    assert len(server.heads) == 1
+    assert server.heads[0]["timeout"] == harvest_module._PROBE_TIMEOUT
+
+
+def test_offline_probe_without_cache_downloads(make_harvest, server):
+    server.offline = True
+    df = make_harvest().load_vote()
+    assert server.gets == 1
+    assert df["dem"].tolist() == [10, 20]
+
+
+def test_probe_session_does_not_retry(tmp_path):
+    harvest = Harvest(cache_dir=str(tmp_path))
+    probe_retries = harvest.probe_session.get_adapter("https://example.com").max_retries
+    assert probe_retries.total == 0
+    assert harvest.session.get_adapter("https://example.com").max_retries.total > 0
+
+
+# One table in every layout the source files come in. A text field with a
+# comma makes the tab-delimited file unparseable as CSV.
+_CSV_TABLE = (
+    "SRPREC_KEY,NAME,BLKREG,SRTOTREG\n"
+    "0600101,Alameda 1,10,\n"
+    "0600102,Alameda 2,,35.5\n"
+    "0600103,Alpine,0,12\n"
+)
+_TSV_TABLE = _CSV_TABLE.replace(",", "\t")
+_TSV_TABLE_WITH_COMMA = _TSV_TABLE.replace("Alpine", "Alpine, upper")
+
+
+def _zip_bytes(name, text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr(name, text)
+    return buffer.getvalue()
+
+
+def _old_read_csv(path):
+    """How tables were parsed before the pyarrow reader."""
+    try:
+        return pd.read_csv(path)
+    except pd.errors.ParserError:
+        return pd.read_csv(path, delimiter="\t")
+
+
+@pytest.mark.parametrize(
+    "name, text, delimiter",
+    [
+        ("data.csv", _CSV_TABLE, ","),
+        ("data.txt", _TSV_TABLE, "\t"),
+        ("data.txt", _TSV_TABLE_WITH_COMMA, "\t"),
+    ],
+)
+def test_load_zip_matches_pandas_and_is_cached(
+    tmp_path, make_harvest, server, name, text, delimiter
+):
+    server.body = _zip_bytes(name, text)
+    path = tmp_path / name
+    path.write_text(text)
+    expected = pd.read_csv(path, delimiter=delimiter)
+    # The old reader misread a tab-delimited file without commas as a single
+    # column. Everywhere else its result is the reference.
+    if text != _TSV_TABLE:
+        pd.testing.assert_frame_equal(_old_read_csv(path), expected)
+
+    df = make_harvest().load_conversion()
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert df["NAME"].dtype == pd.StringDtype("pyarrow")
+
+    cached = make_harvest().load_conversion()
+    assert server.gets == 1
+    pd.testing.assert_frame_equal(cached, df)
+
+    subset = make_harvest().load_conversion(
+        columns=["SRPREC_KEY", "BLKREG"], dtype={"SRPREC_KEY": "int64"}
+    )
+    assert server.gets == 1
+    pd.testing.assert_frame_equal(subset, df[["SRPREC_KEY", "BLKREG"]])
+
+
+@pytest.mark.parametrize("driver", ["ESRI Shapefile", "GPKG"])
+def test_fetch_and_store(tmp_path, make_harvest, server, driver):
+    shapefile_dir = tmp_path / "shapefile"
+    shapefile_dir.mkdir()
+    shapes = gpd.GeoDataFrame(
+        {"GEOID20": ["060014001001", "060014001002"]},
+        geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1)],
+        crs=4269,
+    )
+    shapes.to_file(shapefile_dir / "bg.shp")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for part in shapefile_dir.iterdir():
+            zf.write(part, part.name)
+
+    harvest = make_harvest()
+    server.files = {
+        harvest.vote_url: _zip_bytes("vote.csv", _CSV_TABLE),
+        harvest.conversion_url: _zip_bytes("conversion.txt", _TSV_TABLE),
+        harvest.census_url: _CSV_TABLE.encode(),
+        harvest.shapefile_url: buffer.getvalue(),
+    }
+    out_dir = tmp_path / "out"
+    harvest.fetch_and_store(str(out_dir), driver=driver)
+
+    expected = pd.read_csv(io.StringIO(_CSV_TABLE))
+    for name in ["vote", "conversion", "census"]:
+        stored = pd.read_csv(out_dir / f"{name}_data_2022.csv")
+        pd.testing.assert_frame_equal(stored, expected)
+    extension = ".shp" if driver == "ESRI Shapefile" else ".gpkg"
+    stored = gpd.read_file(out_dir / f"shapefile_data_2022{extension}")
+    assert stored["GEOID20"].tolist() == shapes["GEOID20"].tolist()
+    assert stored.geometry.geom_equals(shapes.geometry).all()
+
+
+def test_fetch_and_store_rejects_unknown_driver(tmp_path, make_harvest):
+    with pytest.raises(ValueError):
+        make_harvest().fetch_and_store(str(tmp_path), driver="GeoJSON")